@@ -18,6 +18,11 @@ import (
 	"gopkg.in/yaml.v3"
 )
 
+// validNamePattern matches valid project IDs: letters, numbers, dashes, and
+// underscores, starting with a letter. Compiled once at package load rather
+// than on every validation call.
+var validNamePattern = regexp.MustCompile(`^[a-zA-Z][a-zA-Z0-9_-]*$`)
+
 type ShellExecutor interface {
 	Exec(ctx context.Context, command string) (executor.Result, error)
 	AddEnv(env []string)
@@ -192,16 +197,19 @@ type Operation struct {
 func (op *Operation) Run(ctx context.Context, executor ShellExecutor) error {
 	logger := logging.FromContext(ctx)
 
-	env := os.Environ()
+	// AddEnv already layers these on top of the process environment, so only
+	// the operation-specific variables are passed along; building a full
+	// os.Environ() copy here would duplicate the entire environment block.
+	extraEnv := make([]string, 0, len(op.Env))
 	if len(op.Env) > 0 {
-		envsAdded := []string{}
+		envsAdded := make([]string, 0, len(op.Env))
 		for k, v := range op.Env {
-			env = append(env, fmt.Sprintf("%s=%s", k, v))
+			extraEnv = append(extraEnv, fmt.Sprintf("%s=%s", k, v))
 			envsAdded = append(envsAdded, k)
 		}
 		logger.Infof("Loading additional %d additional environment variable(s): %v", len(op.Env), envsAdded)
 	}
-	executor.AddEnv(env)
+	executor.AddEnv(extraEnv)
 
 	var failedSteps []string
 	for idx, step := range op.Steps {
@@ -255,7 +263,6 @@ func validateProjectName(id string) error {
 	}
 
 	// Check that all characters are alphanumeric, dash, or underscore
-	validNamePattern := regexp.MustCompile(`^[a-zA-Z][a-zA-Z0-9_-]*$`)
 	if !validNamePattern.MatchString(id) {
 		return fmt.Errorf("ID can only contain letters, numbers, dashes, and underscores")
 	}
@@ -17,13 +17,11 @@ import (
 )
 
 type CommandRegistry struct {
-	rootCmd   *cobra.Command
-	verbosity int
+	rootCmd *cobra.Command
 }
 
 // NewCommandRegistry creates a new instance of CommandRegistry
 func NewCommandRegistry(name string, description string, version string) *CommandRegistry {
-	var verbosity int
 	var path string
 
 	root := &cobra.Command{
@@ -75,11 +73,10 @@ func NewCommandRegistry(name string, description string, version string) *Comman
 		},
 	}
 
-	root.PersistentFlags().CountVarP(&verbosity, "verbose", "v", "Increase verbosity (-v or -vv)")
+	root.PersistentFlags().CountP("verbose", "v", "Increase verbosity (-v or -vv)")
 	root.PersistentFlags().StringVarP(&path, "file", "f", config.DefinitionFile, "Path to the project definition file")
 	return &CommandRegistry{
-		rootCmd:   root,
-		verbosity: verbosity,
+		rootCmd: root,
 	}
 }
 
@@ -102,31 +99,31 @@ func (cr *CommandRegistry) Execute() error {
 func loadConfig(ctx context.Context, path string) (config.ProjectDefinition, error) {
 	logger := logging.FromContext(ctx)
 	pathToUse := path
-	_, err := os.Stat(path)
+	file, err := os.Open(path)
 	if err != nil {
 		if !errors.Is(err, fs.ErrNotExist) {
-			return config.ProjectDefinition{}, err
+			return config.ProjectDefinition{}, fmt.Errorf("failed to open config (%s): %w", path, err)
 		}
 		logger.WithFields(logrus.Fields{
 			"path": path,
 		}).Warn("Config not found at given path, using default")
-		defaultPath, err := config.GetFilePath()
-		if err != nil {
-			if !errors.Is(err, fs.ErrNotExist) {
-				return config.ProjectDefinition{}, err
+		defaultPath, defaultErr := config.GetFilePath()
+		if defaultErr != nil {
+			if !errors.Is(defaultErr, fs.ErrNotExist) {
+				return config.ProjectDefinition{}, defaultErr
 			}
 		} else {
 			pathToUse = defaultPath
 		}
+		file, err = os.Open(pathToUse)
+		if err != nil {
+			return config.ProjectDefinition{}, fmt.Errorf("failed to open config (%s): %w", pathToUse, err)
+		}
 	}
+	defer file.Close()
 	logger.WithFields(logrus.Fields{
 		"path": pathToUse,
 	}).Trace("Found config file")
-	file, err := os.Open(pathToUse)
-	if err != nil {
-		return config.ProjectDefinition{}, fmt.Errorf("failed to open config (%s): %w", pathToUse, err)
-	}
-	defer file.Close()
 
 	cfg, err := config.Load(file)
 	if err != nil {
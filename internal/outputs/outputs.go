@@ -10,29 +10,33 @@ import (
 	"golang.org/x/term"
 )
 
+// messageColors maps color names to ready-to-use printers so each print call
+// avoids rebuilding a color.Color and its closure.
+var messageColors = map[string]*color.Color{
+	"green":  color.New(color.FgGreen),
+	"yellow": color.New(color.FgYellow),
+	"red":    color.New(color.FgRed),
+	"blue":   color.New(color.FgBlue),
+	"cyan":   color.New(color.FgCyan),
+}
+
+var defaultMessageColor = color.New(color.FgWhite)
+
 func PrintColoredMessage(textColor string, message string, args ...any) {
 	PrintColoredMessageTo(os.Stdout, textColor, message, args...)
 }
 
 func PrintColoredMessageTo(w io.Writer, textColor string, message string, args ...any) {
-	var selectedColor color.Attribute
-	switch strings.ToLower(textColor) {
-	case "green":
-		selectedColor = color.FgGreen
-	case "yellow":
-		selectedColor = color.FgYellow
-	case "red":
-		selectedColor = color.FgRed
-	case "blue":
-		selectedColor = color.FgBlue
-	case "cyan":
-		selectedColor = color.FgCyan
-	default:
-		selectedColor = color.FgWhite
+	// Callers pass lowercase names, so try the direct lookup first and only
+	// pay for the ToLower normalization on a miss.
+	selectedColor, ok := messageColors[textColor]
+	if !ok {
+		if selectedColor, ok = messageColors[strings.ToLower(textColor)]; !ok {
+			selectedColor = defaultMessageColor
+		}
 	}
-	colorFunc := color.New(selectedColor).SprintFunc()
 	fullMessage := fmt.Sprintf(message, args...)
-	fmt.Fprintf(w, "%s\n", colorFunc(fullMessage))
+	fmt.Fprintf(w, "%s\n", selectedColor.Sprint(fullMessage))
 }
 
 func PrintTerminalWideLine(char string) {
@@ -45,9 +49,5 @@ func PrintTerminalWideLineTo(w io.Writer, char string) {
 		// fallback to default width
 		width = 40
 	}
-	line := ""
-	for i := 0; i < width; i++ {
-		line += string(char)
-	}
-	fmt.Fprintln(w, line)
+	fmt.Fprintln(w, strings.Repeat(char, width))
 }